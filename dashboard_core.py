@@ -0,0 +1,344 @@
+"""Shared data pipeline and render sections for the wind farm dashboard.
+
+app.py stays a thin entry point that picks the map backend; everything
+that loads, caches or draws lives here so there is a single copy to
+maintain. folium is imported lazily inside the folium map branch so the
+plotly-only deployment never pays its import time or memory.
+"""
+
+import hashlib
+from pathlib import Path
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+from plotly_resampler.aggregation import MinMaxLTTB
+
+# Maximum number of points sent to the browser per time-series trace.
+# More than this is not resolvable on screen anyway.
+MAX_CHART_POINTS = 2000
+
+SCADA_FILE = Path("wind_turbine_scada.csv")
+CACHE_DIR = Path("cache")
+CACHE_SCHEMA = "v3"  # bump when load_data's output schema changes
+
+interval_hours = 10 / 60
+
+
+# -----------------------------
+# LOAD DATA
+# -----------------------------
+def _scada_fingerprint():
+    """Hash the first MB of the SCADA file to key the on-disk cache."""
+    with SCADA_FILE.open("rb") as f:
+        return hashlib.md5(f.read(1 << 20)).hexdigest()
+
+
+@st.cache_data
+def load_data():
+    # Streamlit's in-memory cache dies on every code edit or pod restart;
+    # the parquet copy survives those and skips the slow CSV/date parse.
+    cache_path = CACHE_DIR / f"{_scada_fingerprint()}-{CACHE_SCHEMA}.parquet"
+
+    if cache_path.exists():
+        return pd.read_parquet(cache_path, dtype_backend="pyarrow")
+
+    # The pyarrow engine parses in parallel, and the explicit schema
+    # skips type inference while loading straight into float32 —
+    # plotting, sums and means never need double precision. Keeping the
+    # columns Arrow-backed lets st.dataframe wrap them zero-copy instead
+    # of converting pandas blocks to Arrow on every rerun.
+    df = pd.read_csv(
+        SCADA_FILE,
+        engine="pyarrow",
+        dtype_backend="pyarrow",
+        dtype={
+            "LV ActivePower (kW)": "float32[pyarrow]",
+            "Wind Speed (m/s)": "float32[pyarrow]",
+            "Theoretical_Power_Curve (KWh)": "float32[pyarrow]",
+            "Wind Direction (°)": "float32[pyarrow]",
+        },
+    )
+
+    rename_map = {
+        "Date/Time": "time",
+        "LV ActivePower (kW)": "power",
+        "Wind Speed (m/s)": "wind_speed",
+        "Theoretical_Power_Curve (KWh)": "expected_power",
+        "Wind Direction (°)": "wind_direction"
+    }
+
+    df.rename(columns=rename_map, inplace=True)
+
+    # An explicit format keeps the parse on the vectorized C path;
+    # dayfirst=True falls back to per-row inference.
+    df["time"] = pd.to_datetime(
+        df["time"], format="%d %m %Y %H:%M", cache=True
+    ).astype("timestamp[ms][pyarrow]")
+
+    CACHE_DIR.mkdir(exist_ok=True)
+    df.to_parquet(cache_path, engine="pyarrow", compression="zstd")
+
+    return df
+
+
+# The demo columns are generated on demand, one array per cached call,
+# so sections that never use them (e.g. the energy charts) pay nothing.
+
+@st.cache_data
+def turbine_temperature(power):
+    noise = np.random.default_rng(42).standard_normal(len(power), dtype=np.float32)
+    return 30 + np.asarray(power, dtype=np.float32) * 0.005 + noise * 2
+
+
+@st.cache_data
+def turbine_rotor_speed(wind_speed):
+    noise = np.random.default_rng(43).standard_normal(len(wind_speed), dtype=np.float32)
+    return np.asarray(wind_speed, dtype=np.float32) * 0.8 + noise * 0.5
+
+
+@st.cache_data
+def turbine_coordinates(n):
+    # One (2, n) draw fills a single contiguous block instead of two
+    # separate temporaries.
+    noise = np.random.default_rng(44).standard_normal((2, n), dtype=np.float32)
+    lat = 22.5 + noise[0] * 0.05
+    lon = 88.3 + noise[1] * 0.05
+    return lat, lon
+
+
+@st.cache_data
+def downsample(x, y, n_out=MAX_CHART_POINTS):
+    """Reduce a time series to at most n_out pixel-resolvable points.
+
+    Uses MinMaxLTTB so peaks and troughs survive while the payload
+    shipped to the browser stays O(n_out) instead of O(len(df)).
+    """
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=np.float64)
+
+    if len(y) <= n_out:
+        return x, y
+
+    idx = MinMaxLTTB().arg_downsample(y, n_out=n_out)
+    return x[idx], y[idx]
+
+
+@st.cache_data
+def plant_kpis(df):
+    # Two full-column scans per rerun add up; cache so widget clicks
+    # reduce this to a hash lookup. to_numpy() keeps the sum in one
+    # C-level pass without pandas dispatch.
+    aep = float(df["power"].to_numpy().sum()) * interval_hours / 1000
+    expected = float(df["expected_power"].to_numpy().sum()) * interval_hours / 1000
+    return aep, expected
+
+
+@st.cache_data
+def power_curve_density(wind_speed, power, bins=200):
+    """Bin the power curve into a 2-D histogram.
+
+    Rendering cost becomes O(bins * bins) instead of one marker per
+    SCADA row; log1p keeps sparse bins visible next to the dense ones.
+    """
+    H, x_edges, y_edges = np.histogram2d(
+        np.asarray(wind_speed),
+        np.asarray(power),
+        bins=(bins, bins)
+    )
+    return np.log1p(H.T), x_edges, y_edges
+
+
+# -----------------------------
+# RENDER SECTIONS
+# -----------------------------
+def render_kpis(df):
+    st.subheader("Plant Overview")
+
+    AEP, expected_energy = plant_kpis(df)
+    efficiency = (AEP / expected_energy) * 100
+
+    active_turbines = int(0.95 * 50)
+    total_turbines = 50
+
+    alerts = np.random.randint(0, 5)
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    col1.metric("Annual Energy Production", f"{AEP:.2f} MWh")
+    col2.metric("Operational Efficiency", f"{efficiency:.2f}%")
+    col3.metric("Active Turbines", f"{active_turbines}/{total_turbines}")
+    col4.metric("Active Alerts", alerts)
+
+
+def render_energy_charts(df):
+    st.subheader("Energy Production Analysis")
+
+    AEP, expected_energy = plant_kpis(df)
+    total_loss = expected_energy - AEP
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        fig_energy = go.Figure()
+
+        for column in ["power", "expected_power"]:
+            x, y = downsample(df["time"], df[column])
+            fig_energy.add_trace(go.Scattergl(x=x, y=y, mode="lines", name=column))
+
+        fig_energy.update_layout(
+            title="Actual vs Expected Power Output",
+            xaxis_title="Time",
+            yaxis_title="Power (kW)"
+        )
+        st.plotly_chart(fig_energy, use_container_width=True)
+
+    with col2:
+        fig_loss = px.pie(
+            values=[AEP, total_loss],
+            names=["Actual Energy", "Energy Loss"],
+            title="Energy Loss Analysis"
+        )
+
+        st.plotly_chart(fig_loss, use_container_width=True)
+
+
+def render_technical(df):
+    st.subheader("Turbine Technical Parameters")
+
+    # One figure with two subplots costs one layout serialization and one
+    # st.plotly_chart round-trip instead of two.
+    fig_technical = make_subplots(
+        rows=1,
+        cols=2,
+        shared_xaxes=True,
+        subplot_titles=("Temperature vs Time", "Rotor Speed vs Time")
+    )
+
+    x, y = downsample(df["time"], turbine_temperature(df["power"]))
+    fig_technical.add_trace(
+        go.Scattergl(x=x, y=y, mode="lines", name="temperature"), row=1, col=1
+    )
+
+    x, y = downsample(df["time"], turbine_rotor_speed(df["wind_speed"]))
+    fig_technical.add_trace(
+        go.Scattergl(x=x, y=y, mode="lines", name="rotor_speed"), row=1, col=2
+    )
+
+    st.plotly_chart(fig_technical, use_container_width=True)
+
+
+def render_power_curve(df):
+    density, x_edges, y_edges = power_curve_density(df["wind_speed"], df["power"])
+
+    fig_curve = px.imshow(
+        density,
+        origin="lower",
+        x=x_edges[:-1],
+        y=y_edges[:-1],
+        aspect="auto",
+        color_continuous_scale="Viridis",
+        title="Power Curve (Wind Speed vs Power Output)",
+        labels={"x": "Wind Speed (m/s)", "y": "Power (kW)", "color": "log(1 + count)"}
+    )
+
+    st.plotly_chart(fig_curve, use_container_width=True)
+
+
+def _turbine_statuses(n):
+    # A fixed Generator keeps the fault mask (and the cached map built
+    # from it) stable between reruns.
+    return np.where(np.random.default_rng(7).random(n) < 0.1, "Fault", "Healthy")
+
+
+@st.cache_resource
+def build_map_figure(lat, lon, power, wind_speed, temperature, rotor_speed):
+    # The full map payload is identical between reruns, so build the
+    # figure once per session.
+    map_df = pd.DataFrame({
+        "lat": lat,
+        "lon": lon,
+        "power": power,
+        "wind_speed": wind_speed,
+        "temperature": temperature,
+        "rotor_speed": rotor_speed,
+    })
+
+    map_df["status"] = _turbine_statuses(len(map_df))
+
+    fig = px.scatter_mapbox(
+        map_df,
+        lat="lat",
+        lon="lon",
+        color="status",
+        size="power",
+        hover_data=["wind_speed", "temperature", "rotor_speed"],
+        zoom=8,
+        height=500,
+        title="Turbine Locations"
+    )
+
+    fig.update_layout(
+        mapbox_style="open-street-map",
+        margin=dict(l=0, r=0, t=40, b=0)
+    )
+
+    return fig
+
+
+@st.cache_resource
+def build_map_folium(lat, lon):
+    import folium
+
+    statuses = _turbine_statuses(len(lat))
+    colors = np.where(statuses == "Fault", "red", "green")
+
+    m = folium.Map(location=[float(lat.mean()), float(lon.mean())], zoom_start=8)
+
+    for i, (la, lo, color) in enumerate(zip(lat, lon, colors)):
+        folium.Marker(
+            [float(la), float(lo)],
+            popup=f"Turbine {i + 1}",
+            icon=folium.Icon(color=color),
+        ).add_to(m)
+
+    return m
+
+
+def render_map(df, backend="plotly"):
+    st.subheader("Geographic Turbine Locations")
+
+    lat, lon = turbine_coordinates(50)
+
+    if backend == "folium":
+        from streamlit_folium import st_folium
+
+        st_folium(build_map_folium(lat, lon), use_container_width=True)
+        return
+
+    fig_map = build_map_figure(
+        lat,
+        lon,
+        df["power"].to_numpy()[:50],
+        df["wind_speed"].to_numpy()[:50],
+        turbine_temperature(df["power"])[:50],
+        turbine_rotor_speed(df["wind_speed"])[:50],
+    )
+
+    st.plotly_chart(fig_map, use_container_width=True)
+
+
+def render_table(df):
+    st.subheader("Turbine Data")
+
+    # Slice rows before selecting columns so only the 100 displayed rows
+    # are ever materialized, not full-length column copies.
+    display_df = df.iloc[-100:].loc[:, ["time", "power", "expected_power", "wind_speed"]].assign(
+        temperature=turbine_temperature(df["power"])[-100:],
+        rotor_speed=turbine_rotor_speed(df["wind_speed"])[-100:],
+    )
+
+    st.dataframe(display_df, use_container_width=True)